@@ -5,8 +5,7 @@ Analyzes performance data and generates optimized hooks
 import json
 from typing import Dict, List, Any
 from pydantic import BaseModel
-from openai import OpenAI
-from config.settings import settings
+from external.apis.openai_client import openai_client
 
 class NextGenHook(BaseModel):
     """Schema for next-generation hook suggestions"""
@@ -26,7 +25,7 @@ class HookGenerator:
     """AI agent for generating optimized hooks"""
     
     def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = openai_client.client
     
     def generate_next_gen_hooks(self, winner_ads: List[Dict], current_ad: Dict) -> Dict[str, Any]:
         """Generate next-generation hooks using AI analysis of winning ads"""
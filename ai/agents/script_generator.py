@@ -1,6 +1,7 @@
 """AI script generator for natural human-like voiceovers"""
 from typing import Dict, Any, List
 from config.settings import settings
+from external.apis.openai_client import openai_client
 import os
 
 class ScriptGenerator:
@@ -32,8 +33,9 @@ class ScriptGenerator:
             """
             
             try:
-                from openai import OpenAI
-                client = OpenAI(api_key=self.openai_api_key)
+                client = openai_client.client
+                if not client:
+                    raise ValueError("OpenAI client not configured")
                 
                 response = client.chat.completions.create(
                     model="gpt-4o",
@@ -13,9 +13,12 @@ class Settings:
     APP_NAME = "Relicon AI Video Generation Platform"
     APP_VERSION = "2.0.0"
     DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+    ENVIRONMENT = os.getenv("ENVIRONMENT", "production")
     
     # Database
     DATABASE_URL = os.getenv("DATABASE_URL")
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
     
     # API Keys
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -7,7 +7,7 @@ from .models import (
     ErrorResponse, ShopifyWebhookData,
     MetaPlatformData, TikTokWebhookData
 )
-from .middleware import webhook_validator
+from .middleware import webhook_validator, APIGZipMiddleware
 
 __all__ = [
     'VideoGenerationRequest', 'VideoGenerationResponse',
@@ -16,5 +16,5 @@ __all__ = [
     'EvaluationRequest', 'EvaluationResponse',
     'ErrorResponse', 'ShopifyWebhookData',
     'MetaPlatformData', 'TikTokWebhookData',
-    'webhook_validator'
+    'webhook_validator', 'APIGZipMiddleware'
 ]
\ No newline at end of file
@@ -3,6 +3,7 @@ import hmac
 import hashlib
 from typing import Dict, Any, Optional
 from fastapi import Request, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
 from config.settings import settings
 
 class WebhookValidator:
@@ -35,5 +36,19 @@ class WebhookValidator:
         # TikTok webhook validation logic would go here
         return True  # Placeholder
 
+class APIGZipMiddleware(GZipMiddleware):
+    """GZip compression for API responses that skips already-compressed media"""
+    
+    def __init__(self, app, excluded_prefixes: tuple = ("/outputs",), **kwargs):
+        super().__init__(app, **kwargs)
+        self.excluded_prefixes = excluded_prefixes
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(self.excluded_prefixes):
+            await self.app(scope, receive, send)
+            return
+        
+        await super().__call__(scope, receive, send)
+
 # Global webhook validator
 webhook_validator = WebhookValidator()
\ No newline at end of file
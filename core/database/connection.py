@@ -14,6 +14,7 @@ class DatabaseManager:
         self.engine = None
         self.SessionLocal = None
         self._initialized = False
+        self._tables_created = False
     
     def initialize(self):
         """Initialize database connection"""
@@ -25,6 +26,8 @@ class DatabaseManager:
         
         self.engine = create_engine(
             settings.DATABASE_URL,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
             pool_pre_ping=True,
             pool_recycle=300,
             echo=settings.DEBUG
@@ -40,10 +43,14 @@ class DatabaseManager:
     
     def create_tables(self):
         """Create all database tables"""
+        if self._tables_created:
+            return
+        
         if not self._initialized:
             self.initialize()
         
         Base.metadata.create_all(bind=self.engine)
+        self._tables_created = True
     
     def get_session(self):
         """Get database session"""
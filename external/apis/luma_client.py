@@ -10,6 +10,9 @@ class LumaClient:
     def __init__(self):
         self.api_key = settings.LUMA_API_KEY
         self.base_url = "https://api.lumalabs.ai"
+        
+        # Reuse one keep-alive connection pool for all Luma requests
+        self.session = requests.Session()
     
     def get_account_info(self) -> Dict[str, Any]:
         """Get account information"""
@@ -18,7 +21,7 @@ class LumaClient:
         
         try:
             headers = {"Authorization": f"Bearer {self.api_key}"}
-            response = requests.get(f"{self.base_url}/account", headers=headers)
+            response = self.session.get(f"{self.base_url}/account", headers=headers)
             
             if response.status_code == 200:
                 return response.json()
@@ -40,7 +43,7 @@ class LumaClient:
                 "duration": duration
             }
             
-            response = requests.post(f"{self.base_url}/generate", headers=headers, json=data)
+            response = self.session.post(f"{self.base_url}/generate", headers=headers, json=data)
             
             if response.status_code == 200:
                 return response.json().get("job_id")
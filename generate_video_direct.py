@@ -55,7 +55,12 @@ if __name__ == "__main__":
     if len(sys.argv) < 5:
         print("Usage: python generate_video_direct.py <brand_name> <brand_description> <duration> <output_path>")
         sys.exit(1)
-    
+
+    # Fail fast before paying the video pipeline import cost when no voice provider is configured
+    if not os.getenv("OPENAI_API_KEY") and not os.getenv("ELEVENLABS_API_KEY"):
+        print("ERROR:Neither OPENAI_API_KEY nor ELEVENLABS_API_KEY is set")
+        sys.exit(1)
+
     brand_name = sys.argv[1]
     brand_description = sys.argv[2]
     duration = int(sys.argv[3])
@@ -10,9 +10,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from fastapi import FastAPI, HTTPException, Request, Depends, BackgroundTasks, UploadFile, File
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, case
 from sqlalchemy.orm import Session
 
 # Core system imports
@@ -24,7 +26,7 @@ from core.api import (
     MetricsRequest, MetricsResponse,
     HookGenerationRequest, HookGenerationResponse,
     EvaluationRequest, EvaluationResponse,
-    ErrorResponse, webhook_validator
+    ErrorResponse, webhook_validator, APIGZipMiddleware
 )
 
 # AI and video generation services
@@ -32,11 +34,21 @@ from ai.agents import generate_next_gen_hooks
 from video.services import video_service
 from tasks import fetch_meta_metrics, fetch_tt_metrics, evaluate_creatives
 
+# Prefer orjson for request parsing and response rendering when available
+try:
+    import orjson
+    json_loads = orjson.loads
+    DefaultResponse = ORJSONResponse
+except ImportError:
+    json_loads = json.loads
+    DefaultResponse = JSONResponse
+
 # Initialize FastAPI app - Central Highway
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    default_response_class=DefaultResponse
 )
 
 # Add CORS middleware
@@ -48,9 +60,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress API responses; generated media under /outputs is served as-is
+app.add_middleware(APIGZipMiddleware, minimum_size=1000)
+
 # Mount static files
 app.mount("/outputs", StaticFiles(directory=settings.OUTPUT_DIR), name="outputs")
 
+# Metrics collectors by platform
+METRICS_COLLECTORS = {
+    "meta": fetch_meta_metrics,
+    "tiktok": fetch_tt_metrics
+}
+
 # Initialize database and services on startup
 @app.on_event("startup")
 async def startup_event():
@@ -96,8 +117,8 @@ async def generate_video(
             "style": request.style
         }
         
-        # Generate video
-        result = video_service.generate_video(brand_info)
+        # Generate video off the event loop so other requests keep being served
+        result = await run_in_threadpool(video_service.generate_video, brand_info)
         
         if result.get("success"):
             return VideoGenerationResponse(
@@ -134,7 +155,7 @@ async def generate_simple_video(
             "platform": request.platform
         }
         
-        result = video_service.create_simple_video(brand_info)
+        result = await run_in_threadpool(video_service.create_simple_video, brand_info)
         
         if result.get("success"):
             return VideoGenerationResponse(
@@ -173,11 +194,13 @@ async def generate_hooks(
                 error="Ad not found"
             )
         
-        # Get winner ads
-        winner_ads = db.query(Ads).filter(Ads.winner_tag == True).all()
+        # Get winner ads (only the columns hook analysis reads, no ORM instances)
+        winner_ads = db.query(
+            Ads.ad_id, Ads.platform, Ads.creative_content
+        ).filter(Ads.winner_tag == True).all()
         
         # Generate hooks
-        result = generate_next_gen_hooks(winner_ads, current_ad)
+        result = await run_in_threadpool(generate_next_gen_hooks, winner_ads, current_ad)
         
         return HookGenerationResponse(
             success=True,
@@ -200,11 +223,8 @@ async def collect_metrics(
 ):
     """Collect metrics from advertising platforms"""
     try:
-        if request.platform == "meta":
-            result = fetch_meta_metrics(request.ad_ids, request.date_range)
-        elif request.platform == "tiktok":
-            result = fetch_tt_metrics(request.ad_ids, request.date_range)
-        else:
+        collector = METRICS_COLLECTORS.get(request.platform)
+        if collector is None:
             return MetricsResponse(
                 success=False,
                 platform=request.platform,
@@ -213,6 +233,8 @@ async def collect_metrics(
                 errors=["Unsupported platform"]
             )
         
+        result = collector(request.ad_ids, request.date_range)
+        
         return MetricsResponse(
             success=not result.get("error"),
             platform=request.platform,
@@ -282,7 +304,7 @@ async def shopify_webhook(
             raise HTTPException(status_code=401, detail="Invalid webhook signature")
         
         # Parse webhook data
-        data = json.loads(body)
+        data = json_loads(body)
         webhook_data = ShopifyWebhookData(**data)
         
         # Extract UTM content (ad code)
@@ -323,7 +345,7 @@ async def meta_webhook(
             raise HTTPException(status_code=401, detail="Invalid webhook signature")
         
         # Process Meta webhook data
-        data = json.loads(body)
+        data = json_loads(body)
         # Meta webhook processing logic would go here
         
         return {"status": "success", "message": "Meta webhook processed"}
@@ -348,7 +370,7 @@ async def tiktok_webhook(
             raise HTTPException(status_code=401, detail="Invalid webhook signature")
         
         # Process TikTok webhook data
-        data = json.loads(body)
+        data = json_loads(body)
         # TikTok webhook processing logic would go here
         
         return {"status": "success", "message": "TikTok webhook processed"}
@@ -397,7 +419,7 @@ async def test_video():
             "platform": "universal"
         }
         
-        result = video_service.create_simple_video(brand_info)
+        result = await run_in_threadpool(video_service.create_simple_video, brand_info)
         return result
         
     except Exception as e:
@@ -407,9 +429,12 @@ async def test_video():
 async def get_stats(db: Session = Depends(get_db)):
     """Get system statistics"""
     try:
-        ads_count = db.query(Ads).count()
-        sales_count = db.query(Sales).count()
-        winners_count = db.query(Ads).filter(Ads.winner_tag == True).count()
+        # Count ads and winners in a single pass over the ads table
+        ads_count, winners_count = db.query(
+            func.count(Ads.id),
+            func.coalesce(func.sum(case((Ads.winner_tag == True, 1), else_=0)), 0)
+        ).one()
+        sales_count = db.query(func.count(Sales.id)).scalar()
         
         return {
             "ads": ads_count,
@@ -24,16 +24,25 @@ if __name__ == "__main__":
     os.environ['PYTHONPATH'] = str(Path(__file__).parent)
     
     try:
-        from main import app
-        print("✓ FastAPI app loaded successfully")
+        from config.settings import settings
+        from core.database import init_db
+        
+        # Auto-reload is for development only; production scales across cores
+        reload = settings.ENVIRONMENT == "development"
+        workers = 1 if reload else (os.cpu_count() or 2)
+        
+        # Create tables once here so workers don't race on a fresh database
+        init_db()
         
         # Run the server
         uvicorn.run(
-            app, 
+            "main:app", 
             host="0.0.0.0", 
             port=8000, 
             log_level="info",
-            reload=False
+            reload=reload,
+            workers=workers,
+            timeout_keep_alive=30
         )
     except Exception as e:
         print(f"Failed to start backend: {e}")
@@ -8,5 +8,22 @@ import os
 sys.path.insert(0, os.getcwd())
 
 if __name__ == "__main__":
-    from main import app
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
\ No newline at end of file
+    from config.settings import settings
+    from core.database import init_db
+    
+    # Auto-reload is for development only; production scales across cores
+    reload = settings.ENVIRONMENT == "development"
+    workers = 1 if reload else (os.cpu_count() or 2)
+    
+    # Create tables once here so workers don't race on a fresh database
+    init_db()
+    
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        log_level="info",
+        reload=reload,
+        workers=workers,
+        timeout_keep_alive=30
+    )
\ No newline at end of file
@@ -7,16 +7,39 @@ import requests
 import json
 from typing import Dict, Any
 
+# Request payloads for the endpoint tests
+VIDEO_GENERATION_PAYLOAD = {
+    "brand_name": "Test Brand",
+    "brand_description": "Amazing test product for video generation",
+    "duration": 15,
+    "platform": "universal"
+}
+
+METRICS_COLLECTION_PAYLOAD = {
+    "platform": "meta",
+    "ad_ids": ["123", "456"],
+    "date_range": 7
+}
+
+CREATIVE_EVALUATION_PAYLOAD = {
+    "days": 30,
+    "platform": "meta"
+}
+
 class TestReliconAPI:
     """Test suite for Relicon API endpoints"""
     
     def __init__(self):
         self.base_url = "http://localhost:8000"
         self.headers = {"Content-Type": "application/json"}
+        
+        # Keep one pooled keep-alive connection for every request in the suite
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
     
     def test_health_check(self):
         """Test health check endpoint"""
-        response = requests.get(f"{self.base_url}/health")
+        response = self.session.get(f"{self.base_url}/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
@@ -24,17 +47,9 @@ class TestReliconAPI:
     
     def test_video_generation(self):
         """Test video generation endpoint"""
-        payload = {
-            "brand_name": "Test Brand",
-            "brand_description": "Amazing test product for video generation",
-            "duration": 15,
-            "platform": "universal"
-        }
-        
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/generate-simple-video",
-            json=payload,
-            headers=self.headers
+            json=VIDEO_GENERATION_PAYLOAD
         )
         
         assert response.status_code == 200
@@ -45,7 +60,7 @@ class TestReliconAPI:
     
     def test_stats_endpoint(self):
         """Test stats endpoint"""
-        response = requests.get(f"{self.base_url}/api/stats")
+        response = self.session.get(f"{self.base_url}/api/stats")
         assert response.status_code == 200
         data = response.json()
         assert "ads" in data
@@ -55,16 +70,9 @@ class TestReliconAPI:
     
     def test_metrics_collection(self):
         """Test metrics collection endpoint"""
-        payload = {
-            "platform": "meta",
-            "ad_ids": ["123", "456"],
-            "date_range": 7
-        }
-        
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/collect-metrics",
-            json=payload,
-            headers=self.headers
+            json=METRICS_COLLECTION_PAYLOAD
         )
         
         assert response.status_code == 200
@@ -74,15 +82,9 @@ class TestReliconAPI:
     
     def test_creative_evaluation(self):
         """Test creative evaluation endpoint"""
-        payload = {
-            "days": 30,
-            "platform": "meta"
-        }
-        
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/evaluate-creatives",
-            json=payload,
-            headers=self.headers
+            json=CREATIVE_EVALUATION_PAYLOAD
         )
         
         assert response.status_code == 200
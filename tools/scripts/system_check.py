@@ -4,8 +4,10 @@ System health check script for Relicon AI Video Generation Platform
 Validates all system components and dependencies
 """
 import os
+import shutil
 import subprocess
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from config.settings import settings
 from core.database import db_manager
@@ -76,10 +78,19 @@ class ReliconSystemCheck:
         """Check external API connections"""
         print("\nChecking external APIs...")
         
+        # Probe both APIs concurrently, then report in a fixed order
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            openai_future = None
+            luma_future = None
+            if settings.OPENAI_API_KEY:
+                openai_future = executor.submit(openai_client.generate_text, "Hello", max_tokens=5)
+            if settings.LUMA_API_KEY:
+                luma_future = executor.submit(luma_client.get_account_info)
+        
         # Check OpenAI API
         try:
-            if settings.OPENAI_API_KEY:
-                result = openai_client.generate_text("Hello", max_tokens=5)
+            if openai_future:
+                result = openai_future.result()
                 if result:
                     print("✓ OpenAI API connection successful")
                     self.checks_passed += 1
@@ -94,8 +105,8 @@ class ReliconSystemCheck:
         
         # Check Luma API
         try:
-            if settings.LUMA_API_KEY:
-                account_info = luma_client.get_account_info()
+            if luma_future:
+                account_info = luma_future.result()
                 if not account_info.get("error"):
                     print("✓ Luma API connection successful")
                     self.checks_passed += 1
@@ -112,6 +123,12 @@ class ReliconSystemCheck:
         """Check FFmpeg installation"""
         print("\nChecking FFmpeg...")
         
+        # Skip spawning a process when ffmpeg is not on PATH at all
+        if shutil.which("ffmpeg") is None:
+            print("❌ FFmpeg not found - please install FFmpeg")
+            self.checks_failed += 1
+            return
+        
         try:
             result = subprocess.run(
                 ["ffmpeg", "-version"],
@@ -131,9 +148,6 @@ class ReliconSystemCheck:
         except subprocess.TimeoutExpired:
             print("❌ FFmpeg command timed out")
             self.checks_failed += 1
-        except FileNotFoundError:
-            print("❌ FFmpeg not found - please install FFmpeg")
-            self.checks_failed += 1
         except Exception as e:
             print(f"❌ FFmpeg check failed: {e}")
             self.checks_failed += 1
@@ -62,12 +62,13 @@ class DeploymentPrep:
         
         requirements = [
             "fastapi>=0.104.0",
-            "uvicorn>=0.24.0",
+            "uvicorn[standard]>=0.24.0",
             "sqlalchemy>=2.0.0",
             "psycopg2-binary>=2.9.0",
             "openai>=1.0.0",
             "requests>=2.31.0",
             "pydantic>=2.0.0",
+            "orjson>=3.9.0",
             "python-multipart>=0.0.6",
             "python-dotenv>=1.0.0"
         ]
@@ -4,14 +4,16 @@ import requests
 import subprocess
 from pathlib import Path
 from typing import Optional, Dict, Any
-import time
+import uuid
 from config.settings import settings
+from external.apis.openai_client import openai_client
 
 class EnhancedAudioProcessor:
     """Enhanced audio processor with ElevenLabs and human-like speech"""
     
     def __init__(self):
         self.elevenlabs_api_key = settings.ELEVENLABS_API_KEY
+        self.session = requests.Session()
         self.output_dir = Path(settings.OUTPUT_DIR) / "audio"
         self.output_dir.mkdir(exist_ok=True)
         
@@ -75,10 +77,10 @@ class EnhancedAudioProcessor:
                 "voice_settings": self.voice_settings
             }
             
-            response = requests.post(url, json=data, headers=headers, timeout=30)
+            response = self.session.post(url, json=data, headers=headers, timeout=30)
             
             if response.status_code == 200:
-                output_file = self.output_dir / f"elevenlabs_{int(time.time())}.mp3"
+                output_file = self.output_dir / f"elevenlabs_{uuid.uuid4().hex}.mp3"
                 with open(output_file, 'wb') as f:
                     f.write(response.content)
                 return str(output_file)
@@ -92,9 +94,9 @@ class EnhancedAudioProcessor:
     def _generate_openai_human_audio(self, text: str) -> Optional[str]:
         """Generate human-like audio using OpenAI TTS"""
         try:
-            from openai import OpenAI
-            
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
+            client = openai_client.client
+            if not client:
+                return None
             
             # Humanize text for more natural speech
             humanized_text = self._humanize_text(text)
@@ -106,7 +108,7 @@ class EnhancedAudioProcessor:
                 speed=1.0  # Normal speed for clarity
             )
             
-            output_file = self.output_dir / f"openai_human_{int(time.time())}.mp3"
+            output_file = self.output_dir / f"openai_human_{uuid.uuid4().hex}.mp3"
             response.stream_to_file(output_file)
             
             # Enhance for human qualities
@@ -138,7 +140,7 @@ class EnhancedAudioProcessor:
     def _enhance_human_qualities(self, audio_file: str) -> Optional[str]:
         """Enhance audio to sound more human and less robotic"""
         try:
-            output_file = self.output_dir / f"enhanced_{int(time.time())}.mp3"
+            output_file = self.output_dir / f"enhanced_{uuid.uuid4().hex}.mp3"
             
             # FFmpeg command to enhance human qualities
             cmd = [
@@ -158,7 +160,7 @@ class EnhancedAudioProcessor:
                 str(output_file)
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             if result.returncode == 0:
                 return str(output_file)
@@ -2,6 +2,7 @@
 import os
 import json
 import subprocess
+import uuid
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 import re
@@ -60,7 +61,7 @@ class CaptionGenerator:
         """Add captions to video using FFmpeg"""
         try:
             # Create subtitle file
-            srt_path = self.temp_dir / "captions.srt"
+            srt_path = self.temp_dir / f"captions_{uuid.uuid4().hex}.srt"
             if not self.create_subtitle_file(caption_segments, str(srt_path)):
                 return False
             
@@ -81,7 +82,7 @@ class CaptionGenerator:
                 output_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             # Clean up temp file
             if srt_path.exists():
@@ -101,7 +102,7 @@ class CaptionGenerator:
                 "-of", "csv=p=0", audio_file
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
             if result.returncode == 0 and result.stdout.strip():
                 return float(result.stdout.strip())
             
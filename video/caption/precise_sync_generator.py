@@ -3,6 +3,7 @@ import os
 import json
 import subprocess
 import tempfile
+import uuid
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from config.settings import settings
@@ -118,7 +119,7 @@ class PreciseSyncGenerator:
                 "-of", "csv=p=0", audio_file
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
             if result.returncode == 0 and result.stdout.strip():
                 return float(result.stdout.strip())
             
@@ -155,7 +156,7 @@ class PreciseSyncGenerator:
         """Add precisely synchronized captions to video"""
         try:
             # Create SRT file
-            srt_path = self.temp_dir / "precise_captions.srt"
+            srt_path = self.temp_dir / f"precise_captions_{uuid.uuid4().hex}.srt"
             if not self.create_srt_file(caption_segments, str(srt_path)):
                 return False
             
@@ -178,7 +179,7 @@ class PreciseSyncGenerator:
                 output_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             # Clean up
             if srt_path.exists():
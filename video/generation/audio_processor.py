@@ -46,7 +46,7 @@ class AudioProcessor:
                 output_file
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             return result.returncode == 0
             
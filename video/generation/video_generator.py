@@ -1,6 +1,7 @@
 """Video generation module"""
 import os
 import subprocess
+import uuid
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 from config.settings import settings
@@ -39,12 +40,15 @@ class VideoGenerator:
                 "-i", f"color=c=black:s=1920x1080:d={duration}",
                 "-i", audio_file,
                 "-c:v", "libx264",
+                "-preset", "ultrafast",
+                "-tune", "stillimage",
                 "-c:a", "aac",
                 "-shortest",
+                "-movflags", "+faststart",
                 output_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return result.returncode == 0
             
         except Exception as e:
@@ -54,7 +58,7 @@ class VideoGenerator:
     def create_simple_video(self, brand_info: Dict[str, Any], audio_files: List[str]) -> Optional[str]:
         """Create simple video with audio"""
         try:
-            output_filename = f"simple_{brand_info.get('brand_name', 'brand')}.mp4"
+            output_filename = f"simple_{brand_info.get('brand_name', 'brand')}_{uuid.uuid4().hex[:8]}.mp4"
             output_path = Path(settings.OUTPUT_DIR) / output_filename
             
             # Create a simple black video with audio
@@ -69,12 +73,15 @@ class VideoGenerator:
                     "-i", f"color=c=black:s=1920x1080:d={duration}",
                     "-i", audio_files[0],
                     "-c:v", "libx264",
+                    "-preset", "ultrafast",
+                    "-tune", "stillimage",
                     "-c:a", "aac",
                     "-shortest",
+                    "-movflags", "+faststart",
                     str(output_path)
                 ]
                 
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 
                 if result.returncode == 0:
                     return str(output_path)
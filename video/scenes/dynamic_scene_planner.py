@@ -1,10 +1,20 @@
 """Dynamic scene planning for colorful and creative video backgrounds"""
 import random
+import re
 from typing import Dict, Any, List
 from pathlib import Path
 import subprocess
 from config.settings import settings
 
+# Scene type keyword patterns, checked in priority order
+SCENE_TYPE_PATTERNS = [
+    (re.compile(r"introducing|discover|new|amazing", re.IGNORECASE), "hook"),
+    (re.compile(r"problem|struggle|difficult|challenge", re.IGNORECASE), "problem"),
+    (re.compile(r"solution|answer|fix|solves", re.IGNORECASE), "solution"),
+    (re.compile(r"benefits|advantages|results|experience", re.IGNORECASE), "benefits"),
+    (re.compile(r"buy|order|get|visit|try", re.IGNORECASE), "cta")
+]
+
 class DynamicScenePlanner:
     """Plans dynamic, colorful, and creative video scenes"""
     
@@ -86,6 +96,7 @@ class DynamicScenePlanner:
                 "-i", filter_complex,
                 "-t", str(duration),
                 "-c:v", "libx264",
+                "-preset", "ultrafast",
                 "-pix_fmt", "yuv420p",
                 "-r", "30",
                 "-s", "1080x1920",  # 9:16 aspect ratio
@@ -93,7 +104,7 @@ class DynamicScenePlanner:
                 output_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return result.returncode == 0
             
         except Exception as e:
@@ -102,27 +113,18 @@ class DynamicScenePlanner:
     
     def _determine_scene_type(self, text: str, index: int) -> str:
         """Determine scene type based on content"""
-        text_lower = text.lower()
-        
         # Keywords for different scene types
-        if any(word in text_lower for word in ["introducing", "discover", "new", "amazing"]):
+        for pattern, scene_type in SCENE_TYPE_PATTERNS:
+            if pattern.search(text):
+                return scene_type
+        
+        # Default based on position
+        if index == 0:
             return "hook"
-        elif any(word in text_lower for word in ["problem", "struggle", "difficult", "challenge"]):
-            return "problem"
-        elif any(word in text_lower for word in ["solution", "answer", "fix", "solves"]):
-            return "solution"
-        elif any(word in text_lower for word in ["benefits", "advantages", "results", "experience"]):
-            return "benefits"
-        elif any(word in text_lower for word in ["buy", "order", "get", "visit", "try"]):
+        elif index == len(text) - 1:
             return "cta"
         else:
-            # Default based on position
-            if index == 0:
-                return "hook"
-            elif index == len(text) - 1:
-                return "cta"
-            else:
-                return "solution"
+            return "solution"
     
     def _create_visual_config(self, scene_config: Dict[str, Any], brand_info: Dict[str, Any]) -> Dict[str, Any]:
         """Create visual configuration for scene"""
@@ -1,9 +1,14 @@
 """Enhanced video service with captions, human-like audio, and dynamic scenes"""
 import time
 import os
+import shutil
+import subprocess
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from config.settings import settings
+from external.apis.openai_client import openai_client
 from video.caption.caption_generator import caption_generator
 from video.caption.precise_sync_generator import precise_sync_generator
 from video.audio.enhanced_audio_processor import enhanced_audio_processor
@@ -11,6 +16,15 @@ from video.scenes.dynamic_scene_planner import dynamic_scene_planner
 from video.timing.timing_manager import timing_manager
 from ai.planners.video_planner import video_planner
 
+# Voice styles for each brand style
+VOICE_STYLE_MAPPING = {
+    "professional": "premium",
+    "casual": "conversational",
+    "friendly": "warm",
+    "energetic": "natural",
+    "corporate": "premium"
+}
+
 class EnhancedVideoService:
     """Enhanced video service with advanced features"""
     
@@ -27,6 +41,9 @@ class EnhancedVideoService:
                             progress_callback=None) -> Dict[str, Any]:
         """Create enhanced video with captions, human audio, and dynamic scenes"""
         try:
+            # Per-job token keeps concurrent jobs from sharing intermediate files
+            job_id = uuid.uuid4().hex
+            
             if progress_callback:
                 progress_callback(5, "Planning enhanced video experience...")
             
@@ -82,7 +99,7 @@ class EnhancedVideoService:
                 progress_callback(45, "Creating colorful dynamic backgrounds...")
             
             # Step 5: Create dynamic scene backgrounds
-            scene_videos = self._create_scene_backgrounds(scene_plans)
+            scene_videos = self._create_scene_backgrounds(scene_plans, job_id)
             
             if progress_callback:
                 progress_callback(60, "Generating perfectly synchronized captions...")
@@ -95,7 +112,7 @@ class EnhancedVideoService:
             
             # Step 7: Assemble final video with perfect timing
             final_video = self._assemble_enhanced_video(
-                scene_videos, audio_file, caption_segments, brand_info
+                scene_videos, audio_file, caption_segments, brand_info, job_id
             )
             
             if progress_callback:
@@ -187,66 +204,61 @@ class EnhancedVideoService:
         """Determine voice style based on brand information"""
         brand_style = brand_info.get("style", "professional").lower()
         
-        style_mapping = {
-            "professional": "premium",
-            "casual": "conversational",
-            "friendly": "warm",
-            "energetic": "natural",
-            "corporate": "premium"
-        }
-        
-        return style_mapping.get(brand_style, "premium")
+        return VOICE_STYLE_MAPPING.get(brand_style, "premium")
     
-    def _create_scene_backgrounds(self, scene_plans: List[Dict[str, Any]]) -> List[str]:
+    def _create_scene_backgrounds(self, scene_plans: List[Dict[str, Any]], job_id: str) -> List[str]:
         """Create dynamic background videos for each scene"""
-        scene_videos = []
+        if not scene_plans:
+            return []
         
-        for scene_plan in scene_plans:
-            try:
-                output_path = self.output_dir / "scenes" / f"scene_{scene_plan['index']}.mp4"
-                
-                success = dynamic_scene_planner.create_dynamic_background(
-                    scene_plan, str(output_path)
-                )
-                
-                if success and output_path.exists():
-                    scene_videos.append(str(output_path))
-                else:
-                    # Fallback: create simple colored background
-                    fallback_path = self._create_fallback_background(scene_plan)
-                    if fallback_path:
-                        scene_videos.append(fallback_path)
-                        
-            except Exception as e:
-                print(f"Scene background creation error: {e}")
-                # Create fallback
-                fallback_path = self._create_fallback_background(scene_plan)
-                if fallback_path:
-                    scene_videos.append(fallback_path)
+        # Scene encodes are independent ffmpeg processes, so run a few at once
+        max_workers = min(len(scene_plans), max(1, (os.cpu_count() or 2) // 2))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            scene_videos = list(executor.map(
+                lambda scene_plan: self._create_scene_background(scene_plan, job_id),
+                scene_plans
+            ))
         
-        return scene_videos
+        return [video for video in scene_videos if video]
     
-    def _create_fallback_background(self, scene_plan: Dict[str, Any]) -> Optional[str]:
-        """Create fallback colored background"""
+    def _create_scene_background(self, scene_plan: Dict[str, Any], job_id: str) -> Optional[str]:
+        """Create dynamic background video for a single scene"""
         try:
-            import subprocess
+            output_path = self.output_dir / "scenes" / f"scene_{job_id}_{scene_plan['index']}.mp4"
+            
+            success = dynamic_scene_planner.create_dynamic_background(
+                scene_plan, str(output_path)
+            )
             
+            if success and output_path.exists():
+                return str(output_path)
+            
+        except Exception as e:
+            print(f"Scene background creation error: {e}")
+        
+        # Fallback: create simple colored background
+        return self._create_fallback_background(scene_plan, job_id)
+    
+    def _create_fallback_background(self, scene_plan: Dict[str, Any], job_id: str) -> Optional[str]:
+        """Create fallback colored background"""
+        try:
             colors = scene_plan.get("color_palette", ["#1a1a2e"])
             duration = scene_plan.get("duration", 5)
             
-            output_path = self.output_dir / "scenes" / f"fallback_{scene_plan['index']}.mp4"
+            output_path = self.output_dir / "scenes" / f"fallback_{job_id}_{scene_plan['index']}.mp4"
             
             cmd = [
                 "ffmpeg", "-y",
                 "-f", "lavfi",
                 "-i", f"color=c={colors[0].replace('#', '0x')}:s=1080x1920:d={duration}",
                 "-c:v", "libx264",
+                "-preset", "ultrafast",
                 "-pix_fmt", "yuv420p",
                 "-aspect", "9:16",
                 str(output_path)
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             if result.returncode == 0:
                 return str(output_path)
@@ -259,54 +271,48 @@ class EnhancedVideoService:
     
     def _assemble_enhanced_video(self, scene_videos: List[str], audio_file: str, 
                                caption_segments: List[Dict[str, Any]], 
-                               brand_info: Dict[str, Any]) -> Optional[str]:
+                               brand_info: Dict[str, Any], job_id: str) -> Optional[str]:
         """Assemble final video with scenes, audio, and captions"""
+        concat_file = None
         try:
-            import subprocess
-            
-            # Create temporary video without captions
-            temp_video = self.output_dir / "temp" / f"temp_{int(time.time())}.mp4"
-            
-            if scene_videos:
-                # Concatenate scene videos
-                success = self._concatenate_scenes(scene_videos, str(temp_video))
-                if not success:
-                    return None
+            if len(scene_videos) > 1:
+                # Concatenate scene videos while muxing in the audio
+                concat_file = self._write_concat_list(scene_videos, job_id)
+                video_input = ["-f", "concat", "-safe", "0", "-i", str(concat_file)]
+                video_codec = ["-c:v", "copy"]
+            elif scene_videos:
+                video_input = ["-i", scene_videos[0]]
+                video_codec = ["-c:v", "copy"]
             else:
                 # Create simple background video
                 duration = brand_info.get("duration", 30)
-                cmd = [
-                    "ffmpeg", "-y",
-                    "-f", "lavfi",
-                    "-i", f"color=c=0x1a1a2e:s=1080x1920:d={duration}",
+                video_input = ["-f", "lavfi", "-i", f"color=c=0x1a1a2e:s=1080x1920:d={duration}"]
+                video_codec = [
                     "-c:v", "libx264",
-                    "-aspect", "9:16",
-                    str(temp_video)
+                    "-preset", "ultrafast",
+                    "-tune", "stillimage",
+                    "-aspect", "9:16"
                 ]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode != 0:
-                    return None
             
-            # Add audio to video
-            video_with_audio = self.output_dir / "temp" / f"with_audio_{int(time.time())}.mp4"
+            # Build video track and add audio in a single pass
+            video_with_audio = self.output_dir / "temp" / f"with_audio_{job_id}.mp4"
             
             cmd = [
                 "ffmpeg", "-y",
-                "-i", str(temp_video),
+                *video_input,
                 "-i", audio_file,
-                "-c:v", "copy",
+                *video_codec,
                 "-c:a", "aac",
                 "-shortest",
                 str(video_with_audio)
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             if result.returncode != 0:
                 return None
             
             # Add precise captions
-            final_output = self.output_dir / f"enhanced_{brand_info.get('brand_name', 'video')}_{int(time.time())}.mp4"
+            final_output = self.output_dir / f"enhanced_{brand_info.get('brand_name', 'video')}_{int(time.time())}_{job_id[:8]}.mp4"
             
             if caption_segments:
                 success = precise_sync_generator.add_precise_captions(
@@ -317,62 +323,33 @@ class EnhancedVideoService:
                     return str(final_output)
             
             # If captions fail, return video with audio
-            import shutil
             shutil.move(str(video_with_audio), str(final_output))
             return str(final_output)
             
         except Exception as e:
             print(f"Video assembly error: {e}")
             return None
-    
-    def _concatenate_scenes(self, scene_videos: List[str], output_path: str) -> bool:
-        """Concatenate scene videos into single video"""
-        try:
-            import subprocess
-            
-            if len(scene_videos) == 1:
-                # Single video, just copy
-                import shutil
-                shutil.copy2(scene_videos[0], output_path)
-                return True
-            
-            # Create concat list file
-            concat_file = self.output_dir / "temp" / "concat_list.txt"
-            
-            with open(concat_file, 'w') as f:
-                for video in scene_videos:
-                    f.write(f"file '{video}'\n")
-            
-            # Concatenate videos
-            cmd = [
-                "ffmpeg", "-y",
-                "-f", "concat",
-                "-safe", "0",
-                "-i", str(concat_file),
-                "-c", "copy",
-                output_path
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            # Clean up
-            if concat_file.exists():
+        finally:
+            if concat_file and concat_file.exists():
                 concat_file.unlink()
-            
-            return result.returncode == 0
-            
-        except Exception as e:
-            print(f"Video concatenation error: {e}")
-            return False
+    
+    def _write_concat_list(self, scene_videos: List[str], job_id: str) -> Path:
+        """Write ffmpeg concat demuxer list for scene videos"""
+        concat_file = self.output_dir / "temp" / f"concat_list_{job_id}.txt"
+        
+        with open(concat_file, 'w') as f:
+            for video in scene_videos:
+                f.write(f"file '{video}'\n")
+        
+        return concat_file
     
     def _create_fallback_audio(self, script_segments: List[Dict[str, Any]], 
                              brand_info: Dict[str, Any]) -> Optional[str]:
         """Create fallback audio using OpenAI TTS"""
         try:
-            from openai import OpenAI
-            import time
-            
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
+            client = openai_client.client
+            if not client:
+                return None
             
             # Combine all text
             full_text = " ".join([segment["text"] for segment in script_segments])
@@ -385,7 +362,7 @@ class EnhancedVideoService:
                 speed=1.0  # Normal speed for clarity
             )
             
-            output_file = self.output_dir / "audio" / f"fallback_{int(time.time())}.mp3"
+            output_file = self.output_dir / "audio" / f"fallback_{uuid.uuid4().hex}.mp3"
             response.stream_to_file(output_file)
             
             return str(output_file)
@@ -7,6 +7,8 @@ import sys
 import tempfile
 import json
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Callable
 from config.settings import settings
@@ -14,6 +16,27 @@ from ai.planners import video_planner, script_generator
 from video.generation import video_generator, audio_processor
 from external.apis import luma_client, openai_client
 
+# Maximum TTS requests in flight for a single video
+TTS_MAX_CONCURRENCY = 4
+
+# Luma prompt templates by scene type
+LUMA_PROMPT_TEMPLATES = {
+    "hook": "Dynamic opening scene showcasing {brand_name} with {visual_style} style, attention-grabbing visuals, modern aesthetic",
+    "problem": "Relatable problem scenario, frustrated person, everyday situation, {visual_style} lighting",
+    "solution": "Product demonstration of {brand_name}, clean presentation, {visual_style} style, transformation moment",
+    "benefits": "Happy customer using {brand_name}, positive transformation, {visual_style} aesthetic, aspirational lifestyle",
+    "cta": "Clear call-to-action visual, {brand_name} branding, {visual_style} design, compelling final frame"
+}
+
+# Quality modifiers appended to every Luma prompt
+LUMA_QUALITY_MODIFIERS = ", ".join([
+    "high quality",
+    "professional lighting",
+    "sharp focus",
+    "commercial grade",
+    "smooth motion"
+])
+
 class VideoService:
     """Main service for orchestrating video generation"""
     
@@ -69,11 +92,9 @@ class VideoService:
                 progress_callback(35, "Creating voiceovers...")
             
             # Step 4: Generate voiceovers
+            audio_files = self._generate_voiceovers(script_segments)
             audio_segments = []
-            for i, segment in enumerate(script_segments):
-                audio_file = self.audio_proc.create_advertisement_voiceover(
-                    segment["text"], voice="alloy"
-                )
+            for i, (segment, audio_file) in enumerate(zip(script_segments, audio_files)):
                 if audio_file:
                     audio_segments.append({
                         "index": i,
@@ -112,7 +133,7 @@ class VideoService:
                 progress_callback(70, "Assembling final video...")
             
             # Step 6: Assemble final video
-            output_filename = f"{brand_info.get('brand_name', 'video')}_{int(time.time())}.mp4"
+            output_filename = f"{brand_info.get('brand_name', 'video')}_{int(time.time())}_{uuid.uuid4().hex[:8]}.mp4"
             output_path = self.output_dir / output_filename
             
             success = self.video_gen.create_video_from_segments(
@@ -141,6 +162,20 @@ class VideoService:
             print(error_msg)
             return {"success": False, "error": error_msg}
     
+    def _generate_voiceovers(self, script_segments: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Generate voiceovers for all segments concurrently, preserving order"""
+        if not script_segments:
+            return []
+        
+        # Each TTS call is dominated by waiting on the OpenAI API
+        with ThreadPoolExecutor(max_workers=min(TTS_MAX_CONCURRENCY, len(script_segments))) as executor:
+            return list(executor.map(
+                lambda segment: self.audio_proc.create_advertisement_voiceover(
+                    segment["text"], voice="alloy"
+                ),
+                script_segments
+            ))
+    
     def _generate_luma_video(self, scene: Dict[str, Any], 
                            brand_info: Dict[str, Any]) -> Optional[str]:
         """Generate Luma video for a scene"""
@@ -178,26 +213,10 @@ class VideoService:
         visual_style = scene.get("visual_style", "professional")
         brand_name = brand_info.get("brand_name", "product")
         
-        prompt_templates = {
-            "hook": f"Dynamic opening scene showcasing {brand_name} with {visual_style} style, attention-grabbing visuals, modern aesthetic",
-            "problem": f"Relatable problem scenario, frustrated person, everyday situation, {visual_style} lighting",
-            "solution": f"Product demonstration of {brand_name}, clean presentation, {visual_style} style, transformation moment",
-            "benefits": f"Happy customer using {brand_name}, positive transformation, {visual_style} aesthetic, aspirational lifestyle",
-            "cta": f"Clear call-to-action visual, {brand_name} branding, {visual_style} design, compelling final frame"
-        }
-        
-        base_prompt = prompt_templates.get(scene_type, f"Professional {brand_name} commercial scene")
-        
-        # Add quality modifiers
-        quality_modifiers = [
-            "high quality",
-            "professional lighting",
-            "sharp focus",
-            "commercial grade",
-            "smooth motion"
-        ]
+        template = LUMA_PROMPT_TEMPLATES.get(scene_type, "Professional {brand_name} commercial scene")
+        base_prompt = template.format(brand_name=brand_name, visual_style=visual_style)
         
-        return f"{base_prompt}, {', '.join(quality_modifiers)}"
+        return f"{base_prompt}, {LUMA_QUALITY_MODIFIERS}"
     
     def create_simple_video(self, brand_info: Dict[str, Any]) -> Dict[str, Any]:
         """Create a simple video without Luma AI (faster generation)"""
@@ -216,7 +235,7 @@ class VideoService:
             
             # Create simple video
             duration = brand_info.get("duration", 30)
-            output_filename = f"{brand_info.get('brand_name', 'video')}_{int(time.time())}.mp4"
+            output_filename = f"{brand_info.get('brand_name', 'video')}_{int(time.time())}_{uuid.uuid4().hex[:8]}.mp4"
             output_path = self.output_dir / output_filename
             
             segments = [{
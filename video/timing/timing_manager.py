@@ -1,6 +1,6 @@
 """Timing manager for perfect video, audio, and caption synchronization"""
 import os
-import time
+import uuid
 import subprocess
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
@@ -151,7 +151,7 @@ class TimingManager:
                 print(f"Speed adjustment too extreme: {speed_factor}")
                 return None
             
-            output_file = self.temp_dir / f"adjusted_audio_{int(time.time())}.mp3"
+            output_file = self.temp_dir / f"adjusted_audio_{uuid.uuid4().hex}.mp3"
             
             cmd = [
                 "ffmpeg", "-y",
@@ -162,7 +162,7 @@ class TimingManager:
                 str(output_file)
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             if result.returncode == 0:
                 return str(output_file)
@@ -181,7 +181,7 @@ class TimingManager:
                 "-of", "csv=p=0", audio_file
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
             if result.returncode == 0 and result.stdout.strip():
                 return float(result.stdout.strip())
             
@@ -220,7 +220,7 @@ class TimingManager:
                 "-of", "csv=p=0", video_file
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
             if result.returncode == 0 and result.stdout.strip():
                 return float(result.stdout.strip())
             